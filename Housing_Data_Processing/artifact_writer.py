@@ -0,0 +1,138 @@
+# artifact_writer.py
+
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from Parser.errors import FileHandlingError
+
+# Read the umask once at import, before any writer threads exist, since reading it
+# means briefly changing it for the whole process. mkstemp creates files as 0600;
+# renamed artifacts get the default mode for this umask instead.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+FILE_MODE = 0o666 & ~_UMASK
+
+class ArtifactWriter:
+    """
+    Writes pipeline artifacts concurrently on a background thread pool.
+
+    Each artifact is written to a hidden temporary file in its target directory
+    and renamed into place only once it is complete, so readers never see a
+    partial file. Finished files get the usual permissions for the process
+    umask, and their checksums are recorded in a JSON manifest, keyed by path
+    relative to the manifest, when `wait` is called.
+    """
+
+    def __init__(self, manifest_path, max_workers=4):
+        self.manifest_path = manifest_path
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="artifact-writer")
+        self._futures = []
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def submit(self, path, write_fn, description=None):
+        """
+        Schedules `write_fn(tmp_path)` to write the artifact for `path` in the background.
+        If a description is given, it is reported once the artifact is in place.
+        Returns the future of the write.
+        """
+        future = self._executor.submit(self._write, path, write_fn, description)
+        with self._lock:
+            self._futures.append(future)
+        return future
+
+    def _write(self, path, write_fn, description):
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+        os.close(fd)
+        try:
+            write_fn(tmp_path)
+            checksum = file_sha256(tmp_path)
+            size = os.path.getsize(tmp_path)
+            os.chmod(tmp_path, FILE_MODE)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        if description:
+            print(f"{description} saved at {path}")
+
+        manifest_dir = os.path.dirname(os.path.abspath(self.manifest_path))
+        with self._lock:
+            self._entries[os.path.relpath(os.path.abspath(path), manifest_dir)] = {
+                "sha256": checksum,
+                "bytes": size,
+                "written_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+        return path
+
+    def wait(self):
+        """
+        Blocks until every submitted artifact has been written, then updates the manifest.
+        Raises FileHandlingError if any write failed.
+        """
+        with self._lock:
+            futures, self._futures = self._futures, []
+        errors = [future.exception() for future in futures]
+        errors = [error for error in errors if error is not None]
+
+        self._write_manifest()
+        if errors:
+            raise FileHandlingError(
+                f"{len(errors)} artifact write(s) failed: " + "; ".join(str(error) for error in errors)
+            )
+
+    def _write_manifest(self):
+        with self._lock:
+            entries, self._entries = self._entries, {}
+        if not entries:
+            return
+
+        manifest = {}
+        if os.path.isfile(self.manifest_path):
+            with open(self.manifest_path, "r") as f:
+                manifest = json.load(f)
+        manifest.update(entries)
+
+        directory = os.path.dirname(self.manifest_path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(self.manifest_path)}.", suffix=".tmp", dir=directory)
+        with os.fdopen(fd, "w") as f:
+            json.dump(manifest, f, indent=4, sort_keys=True)
+        os.chmod(tmp_path, FILE_MODE)
+        os.replace(tmp_path, self.manifest_path)
+
+    def close(self):
+        """Waits for pending writes and shuts down the thread pool."""
+        try:
+            self.wait()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+            return
+        # Still flush queued writes, but let the original exception propagate
+        try:
+            self.close()
+        except FileHandlingError as error:
+            print(f"Artifact writes also failed: {error}")
+
+
+def file_sha256(path, block_size=1 << 20):
+    """Returns the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
@@ -13,6 +13,7 @@ class BaseDataTransformation(ABC):
         self.save_path = save_path
         self.housing = None
         self.housing_labels = None
+        self.feature_engineering = None
 
     @abstractmethod
     def clean_data(self, data: pd.DataFrame):
@@ -28,3 +29,7 @@ class BaseDataTransformation(ABC):
         """Sets a new path for saving transformed data and labels."""
         self.save_path = path
 
+    def set_feature_engineering(self, feature_engineering):
+        """Sets the parsed 'feature_engineering' config section used to derive extra features."""
+        self.feature_engineering = feature_engineering
+
@@ -9,6 +9,7 @@ from sklearn.preprocessing import StandardScaler, OneHotEncoder
 from sklearn.base import BaseEstimator, TransformerMixin
 from sklearn.model_selection import StratifiedShuffleSplit
 from base_data_transformation import BaseDataTransformation
+from feature_engineering import FeaturePlanTransformer
 
 class CombinedAttributesAdder(BaseEstimator, TransformerMixin):
     def __init__(self, add_bedrooms_per_room=True):
@@ -55,14 +56,24 @@ class CaliforniaHousingTransformation(BaseDataTransformation):
     def transform_features(self, data):
         """Applies California housing-specific transformations and feature scaling."""
         housing_num = data.drop("ocean_proximity", axis=1)
-        
+        num_attribs = list(housing_num)
+
+        # Derived features come from the config file when declared there
+        if self.feature_engineering:
+            attribs_adder = FeaturePlanTransformer(
+                features=self.feature_engineering["features"],
+                columns=num_attribs,
+                chunk_size=self.feature_engineering["chunk_size"]
+            )
+        else:
+            attribs_adder = CombinedAttributesAdder()
+
         num_pipeline = Pipeline([
             ('imputer', SimpleImputer(strategy='median')),
-            ('attribs_adder', CombinedAttributesAdder()),
+            ('attribs_adder', attribs_adder),
             ('std_scaler', StandardScaler())
         ])
         
-        num_attribs = list(housing_num)
         cat_attribs = ["ocean_proximity"]
 
         full_pipeline = ColumnTransformer([
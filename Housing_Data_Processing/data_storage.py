@@ -3,33 +3,75 @@
 import os
 import numpy as np
 import pandas as pd
+from artifact_writer import ArtifactWriter
+from Parser.errors import FileHandlingError
 
 class DataStorage:
-    def __init__(self, save_path='./cleanDatasets', dataset_name="default"):
+    def __init__(self, save_path='./cleanDatasets', dataset_name="default", writer=None):
         self.save_path = save_path
         self.dataset_name = dataset_name
         os.makedirs(self.save_path, exist_ok=True)  # Ensure save_path exists
+        manifest_path = os.path.join(self.save_path, f"{self.dataset_name}_manifest.json")
+        self._owns_writer = writer is None
+        self.writer = ArtifactWriter(manifest_path) if self._owns_writer else writer
 
     def save_labels(self, labels):
-        """Saves training labels to a CSV file."""
+        """Saves training labels to a CSV file in the background."""
         labels_path = os.path.join(self.save_path, f"{self.dataset_name}_labels.csv")
-        np.savetxt(labels_path, labels, delimiter=",")
-        print(f"Labels saved at {labels_path}")
+
+        def write(tmp_path):
+            np.savetxt(tmp_path, labels, delimiter=",")
+
+        return self.writer.submit(labels_path, write, description="Labels")
 
     def save_transformed_data(self, data):
-        """Saves transformed training data to a CSV file."""
+        """Saves transformed training data to a CSV file in the background."""
         data_path = os.path.join(self.save_path, f"{self.dataset_name}_prepared.csv")
-        np.savetxt(data_path, data, delimiter=",")
-        print(f"Processed data saved at {data_path}")
+
+        def write(tmp_path):
+            np.savetxt(tmp_path, data, delimiter=",")
+
+        return self.writer.submit(data_path, write, description="Processed data")
 
     def save_test_data(self, test_data, test_labels):
-        """Saves testing data and labels to CSV files."""
+        """Saves testing data and labels to CSV files in the background."""
         test_data_path = os.path.join(self.save_path, f"{self.dataset_name}_test.csv")
         test_labels_path = os.path.join(self.save_path, f"{self.dataset_name}_test_labels.csv")
 
-        pd.DataFrame(test_data).to_csv(test_data_path, index=False)
-        pd.DataFrame(test_labels).to_csv(test_labels_path, index=False)
+        def write_data(tmp_path):
+            pd.DataFrame(test_data).to_csv(tmp_path, index=False)
+
+        def write_labels(tmp_path):
+            pd.DataFrame(test_labels).to_csv(tmp_path, index=False)
+
+        return (
+            self.writer.submit(test_data_path, write_data, description="Test data"),
+            self.writer.submit(test_labels_path, write_labels, description="Test labels")
+        )
+
+    def wait(self):
+        """Blocks until all pending writes are on disk and the manifest is updated."""
+        self.writer.wait()
+
+    def close(self):
+        """
+        Waits for pending writes. The writer's thread pool is only shut down if this
+        DataStorage created it; a writer passed in by the caller stays usable.
+        """
+        if self._owns_writer:
+            self.writer.close()
+        else:
+            self.writer.wait()
 
-        print(f"Test data saved at {test_data_path}")
-        print(f"Test labels saved at {test_labels_path}")
+    def __enter__(self):
+        return self
 
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+            return
+        # Still flush queued writes, but let the original exception propagate
+        try:
+            self.close()
+        except FileHandlingError as error:
+            print(f"Artifact writes also failed: {error}")
@@ -34,17 +34,20 @@ def run_etl_pipeline(config, TransformationClass, dataset_name):
 
     # Use the TransformationClass for this specific dataset
     transformation = TransformationClass(save_path=save_data_path)
-    housing, housing_labels, housing_test, housing_labels_test = transformation.clean_data(housing)
-    housing_prepared = transformation.transform_features(housing)
-    housing_test = transformation.transform_features(housing_test)
-    
-    # Store processed data and labels with dataset_name for dynamic naming
-    storage = DataStorage(save_path=save_data_path, dataset_name=dataset_name)
-    storage.save_labels(housing_labels)
-    storage.save_transformed_data(housing_prepared)
-    
-    # save the test data
-    storage.save_test_data(housing_test, housing_labels_test)
+    transformation.set_feature_engineering(config.get("feature_engineering"))
+
+    # Store processed data and labels with dataset_name for dynamic naming.
+    # Writes run in the background so they overlap with the remaining transformations;
+    # leaving the block waits for all artifacts to be renamed into place.
+    with DataStorage(save_path=save_data_path, dataset_name=dataset_name) as storage:
+        housing, housing_labels, housing_test, housing_labels_test = transformation.clean_data(housing)
+        storage.save_labels(housing_labels)
+        housing_prepared = transformation.transform_features(housing)
+        storage.save_transformed_data(housing_prepared)
+        housing_test = transformation.transform_features(housing_test)
+
+        # save the test data
+        storage.save_test_data(housing_test, housing_labels_test)
     
     # Check if training data and labels are saved correctly
     training_data_path = os.path.join(save_data_path, f"{storage.dataset_name}_prepared.csv")
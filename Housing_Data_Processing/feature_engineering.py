@@ -0,0 +1,194 @@
+# feature_engineering.py
+
+import numpy as np
+from sklearn.base import BaseEstimator, TransformerMixin
+from Parser.errors import ConfigError
+
+EARTH_RADIUS_KM = 6371.0
+DEFAULT_CHUNK_SIZE = 65536
+
+# Elementwise kernels used by the evaluation plan. Each kernel receives the
+# already computed input arrays followed by the node's scalar parameters.
+KERNELS = {
+    "div": lambda a, b: np.divide(a, b),
+    "log": lambda a, offset: np.log(a + offset) if offset else np.log(a),
+    "digitize": lambda a, bins: np.digitize(a, bins).astype(np.float64),
+    "clip": lambda a, lower, upper: np.clip(a, lower, upper),
+    "radians": lambda a: np.radians(a),
+    "sub_scalar": lambda a, value: a - value,
+    "half_sin_sq": lambda a: np.square(np.sin(a / 2.0)),
+    "cos": lambda a: np.cos(a),
+    "mul": lambda a, b: a * b,
+    "mul_scalar": lambda a, value: a * value,
+    "add": lambda a, b: a + b,
+    "haversine_km": lambda a: 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0))),
+}
+
+
+class FeaturePlan:
+    """
+    Compiled evaluation plan for the derived features declared in the config file.
+
+    Every feature is lowered to a graph of elementwise nodes. Identical nodes
+    (same kernel, same inputs, same parameters) are only created once, so a
+    column shared by several features is loaded once and an intermediate such
+    as the cosine of a latitude is computed once per chunk.
+    """
+
+    def __init__(self, columns, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.columns = list(columns)
+        self.chunk_size = chunk_size
+        self.nodes = []           # (kernel, input node ids, params)
+        self.outputs = []         # node id of each derived feature
+        self.feature_names = []
+        self._node_ids = {}
+        self._names = {}
+
+    def _node(self, kernel, inputs=(), params=()):
+        key = (kernel, tuple(inputs), tuple(params))
+        if key not in self._node_ids:
+            self._node_ids[key] = len(self.nodes)
+            self.nodes.append(key)
+        return self._node_ids[key]
+
+    def _ref(self, feature, name):
+        """Resolves a column or an earlier derived feature referenced by a spec."""
+        if name in self._names:
+            return self._names[name]
+        if name in self.columns:
+            self._names[name] = self._node("col", params=(self.columns.index(name),))
+            return self._names[name]
+        raise ConfigError(
+            f"Feature '{feature}' references unknown column '{name}'. "
+            f"Available columns: {', '.join(self.columns + self.feature_names)}"
+        )
+
+    def add_feature(self, spec):
+        """Lowers a single feature specification into plan nodes."""
+        name = spec.get("name")
+        op = spec.get("op")
+        if not isinstance(name, str) or not name:
+            raise ConfigError("Each derived feature must have a non-empty 'name'.")
+        if name in self.columns or name in self.feature_names:
+            raise ConfigError(f"Derived feature '{name}' is defined more than once.")
+        if op not in FEATURE_OPS:
+            raise ConfigError(
+                f"Derived feature '{name}' uses unknown op '{op}'. Available ops: {', '.join(FEATURE_OPS)}"
+            )
+        try:
+            node = FEATURE_OPS[op](self, name, spec)
+        except KeyError as missing:
+            raise ConfigError(f"Derived feature '{name}' ({op}) is missing the field {missing}.")
+        except (TypeError, ValueError):
+            raise ConfigError(f"Derived feature '{name}' ({op}) has invalid parameter values.")
+        self._names[name] = node
+        self.outputs.append(node)
+        self.feature_names.append(name)
+
+    def transform(self, X):
+        """Evaluates every derived feature in one chunk-wise pass and appends them to X."""
+        X = np.asarray(X, dtype=np.float64)
+        n_rows, n_cols = X.shape
+        result = np.empty((n_rows, n_cols + len(self.outputs)), dtype=np.float64)
+        result[:, :n_cols] = X
+
+        # Drop intermediates as soon as their last consumer has run
+        last_use = {}
+        for node_id, (_, inputs, _) in enumerate(self.nodes):
+            for input_id in inputs:
+                last_use[input_id] = node_id
+        outputs = set(self.outputs)
+
+        for start in range(0, n_rows, self.chunk_size):
+            stop = min(start + self.chunk_size, n_rows)
+            chunk = X[start:stop]
+            values = {}
+            for node_id, (kernel, inputs, params) in enumerate(self.nodes):
+                if kernel == "col":
+                    values[node_id] = chunk[:, params[0]]
+                else:
+                    values[node_id] = KERNELS[kernel](*(values[i] for i in inputs), *params)
+                for input_id in set(inputs):
+                    if last_use[input_id] == node_id and input_id not in outputs:
+                        del values[input_id]
+            for offset, node_id in enumerate(self.outputs):
+                result[start:stop, n_cols + offset] = values[node_id]
+        return result
+
+
+def _ratio(plan, name, spec):
+    return plan._node("div", (plan._ref(name, spec["numerator"]), plan._ref(name, spec["denominator"])))
+
+
+def _log(plan, name, spec):
+    return plan._node("log", (plan._ref(name, spec["column"]),), (float(spec.get("offset", 0.0)),))
+
+
+def _bin(plan, name, spec):
+    bins = tuple(float(edge) for edge in spec["bins"])
+    if not bins or list(bins) != sorted(bins):
+        raise ValueError("bins must be a non-empty increasing list")
+    return plan._node("digitize", (plan._ref(name, spec["column"]),), (bins,))
+
+
+def _clip(plan, name, spec):
+    lower = spec.get("lower")
+    upper = spec.get("upper")
+    if lower is None and upper is None:
+        raise ValueError("clip needs 'lower' and/or 'upper'")
+    lower = -np.inf if lower is None else float(lower)
+    upper = np.inf if upper is None else float(upper)
+    return plan._node("clip", (plan._ref(name, spec["column"]),), (lower, upper))
+
+
+def _geo_distance(plan, name, spec):
+    """Great-circle (haversine) distance in kilometres to a fixed point."""
+    target_lat, target_lon = (float(value) for value in spec["target"])
+    lat = plan._node("radians", (plan._ref(name, spec.get("latitude", "latitude")),))
+    lon = plan._node("radians", (plan._ref(name, spec.get("longitude", "longitude")),))
+    target_lat, target_lon = np.radians(target_lat), np.radians(target_lon)
+
+    dlat = plan._node("half_sin_sq", (plan._node("sub_scalar", (lat,), (target_lat,)),))
+    dlon = plan._node("half_sin_sq", (plan._node("sub_scalar", (lon,), (target_lon,)),))
+    cos_lat = plan._node("mul_scalar", (plan._node("cos", (lat,)),), (np.cos(target_lat),))
+    a = plan._node("add", (dlat, plan._node("mul", (cos_lat, dlon))))
+    return plan._node("haversine_km", (a,))
+
+
+FEATURE_OPS = {
+    "ratio": _ratio,
+    "log": _log,
+    "bin": _bin,
+    "clip": _clip,
+    "geo_distance": _geo_distance,
+}
+
+
+def compile_feature_plan(features, columns, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Compiles the 'feature_engineering' feature specs into a FeaturePlan over the given columns.
+    Raises ConfigError for unknown ops, unknown columns or malformed parameters.
+    """
+    plan = FeaturePlan(columns, chunk_size)
+    for spec in features:
+        plan.add_feature(spec)
+    return plan
+
+
+class FeaturePlanTransformer(BaseEstimator, TransformerMixin):
+    """
+    Appends the derived features declared in the config file to a numeric array.
+    Drop-in replacement for hand-written attribute adders inside a numeric pipeline.
+    """
+
+    def __init__(self, features=(), columns=(), chunk_size=DEFAULT_CHUNK_SIZE):
+        self.features = features
+        self.columns = columns
+        self.chunk_size = chunk_size
+
+    def fit(self, X, y=None):
+        self.plan_ = compile_feature_plan(self.features, self.columns, self.chunk_size)
+        return self
+
+    def transform(self, X, y=None):
+        return self.plan_.transform(X)
@@ -5,6 +5,7 @@ import os
 import sys
 from Parser.parser import parse_config, get_model_class
 from training import train_model, evaluate_model, create_results_directory, save_run_summary
+from Housing_Data_Processing.artifact_writer import ArtifactWriter
 import pandas as pd
 
 # Step 1: Parse configuration file (from command line argument)
@@ -58,7 +59,8 @@ y_test = pd.read_csv(testing_labels_path).values.ravel()
 # Step 3: Create results directory based on model name, metrics, and timestamp
 results_path = create_results_directory(
     model_name=parsed_data["model_name"],
-    evaluation_metrics=parsed_data["evaluation_metric"]
+    evaluation_metrics=parsed_data["evaluation_metric"],
+    base_path=parsed_data["paths"]["results"] or "."
 )
 
 # Step 4: Initialize the model using the model name from parsed_data
@@ -76,26 +78,30 @@ best_model, best_params, cv_results = train_model(
     evaluation_metrics=parsed_data["evaluation_metric"]
 )
 
-# Step 6: Evaluate the model
-metrics = evaluate_model(
-    model=best_model,
-    X_test=X_test,
-    y_test=y_test,
-    results_path=parsed_data["paths"]["results"],
-    model_name=parsed_data["model_name"],
-    evaluation_metrics=parsed_data["evaluation_metric"],
-    best_params=best_params,
-    cv_results=cv_results
-)
-
-# Step 7: Save run summary in the results directory
-save_run_summary(
-    results_path=results_path,
-    model_name=parsed_data["model_name"],
-    evaluation_metrics=parsed_data["evaluation_metric"],
-    best_params=best_params,
-    metrics=metrics
-)
+# Steps 6-7: Evaluate the model and save the run summary. All artifacts of the run are
+# written in the background to the results directory; leaving the block waits for them
+# and records their checksums in the run's manifest.
+with ArtifactWriter(os.path.join(results_path, "manifest.json")) as artifact_writer:
+    metrics = evaluate_model(
+        model=best_model,
+        X_test=X_test,
+        y_test=y_test,
+        results_path=results_path,
+        model_name=parsed_data["model_name"],
+        evaluation_metrics=parsed_data["evaluation_metric"],
+        best_params=best_params,
+        cv_results=cv_results,
+        writer=artifact_writer
+    )
+
+    save_run_summary(
+        results_path=results_path,
+        model_name=parsed_data["model_name"],
+        evaluation_metrics=parsed_data["evaluation_metric"],
+        best_params=best_params,
+        metrics=metrics,
+        writer=artifact_writer
+    )
 
 # Print the evaluation metrics
 print("Training and evaluation completed. Metrics:", metrics)
@@ -5,6 +5,7 @@ from joblib import dump
 import json
 import os
 from datetime import datetime
+from Housing_Data_Processing.artifact_writer import ArtifactWriter
 
 # Define a mapping of available scoring functions for regression
 SCORING_FUNCTIONS = {
@@ -45,7 +46,7 @@ def train_model(model_name, model, X_train, y_train, param_grid, cv, evaluation_
     return best_model, best_params, cv_results
 
 
-def evaluate_model(model, X_test, y_test, results_path, model_name, evaluation_metrics, best_params=None, cv_results=None):
+def evaluate_model(model, X_test, y_test, results_path, model_name, evaluation_metrics, best_params=None, cv_results=None, writer=None):
     """
     Evaluates the model based on specified metrics and saves results to the specified path.
     
@@ -57,6 +58,8 @@ def evaluate_model(model, X_test, y_test, results_path, model_name, evaluation_m
     - evaluation_metric (list): List of metrics to calculate (from configuration).
     - best_params (dict): Best hyperparameters if GridSearchCV was used, else None.
     - cv_results (dict): Cross-validation results if GridSearchCV was used, else None.
+    - writer (ArtifactWriter): Writer for the saved artifacts. If None, a local writer is used and
+      waited on before returning; otherwise the caller is responsible for calling `writer.wait()`.
     
     Returns:
     - metrics (dict): Calculated metrics based on the specified list.
@@ -80,38 +83,53 @@ def evaluate_model(model, X_test, y_test, results_path, model_name, evaluation_m
         else:
             raise ValueError(f"Unsupported evaluation metric '{metric}' specified.")
 
-    # Save metrics, best parameters, and cross-validation results
-    dump(metrics, os.path.join(results_path, f"{model_name}_metrics.joblib"))
+    own_writer = writer is None
+    if own_writer:
+        writer = ArtifactWriter(os.path.join(results_path, f"{model_name}_manifest.json"))
+
+    # Save metrics, best parameters, and cross-validation results in the background
+    save_joblib(writer, metrics, os.path.join(results_path, f"{model_name}_metrics.joblib"))
 
     # Save cv_results with joblib
     if cv_results:
-        dump(cv_results, os.path.join(results_path, f"{model_name}_cv_results.joblib"))
+        save_joblib(writer, cv_results, os.path.join(results_path, f"{model_name}_cv_results.joblib"))
 
     # Save the best parameters with joblib
     if best_params:
-        dump(best_params, os.path.join(results_path, f"{model_name}_best_params.joblib"))
+        save_joblib(writer, best_params, os.path.join(results_path, f"{model_name}_best_params.joblib"))
 
     # Save the trained model
-    dump(model, os.path.join(results_path, f"{model_name}_best_model.joblib"))
+    save_joblib(writer, model, os.path.join(results_path, f"{model_name}_best_model.joblib"))
+
+    if own_writer:
+        writer.close()
     print(f"Evaluation for {model_name} completed successfully.")
     return metrics
 
 
-def create_results_directory(model_name, evaluation_metrics):
+def save_joblib(writer, obj, path):
+    """
+    Schedules a joblib dump of obj to path on the given ArtifactWriter.
     """
-    Creates a results directory based on model name, evaluation metrics, and timestamp.
+    return writer.submit(path, lambda tmp_path: dump(obj, tmp_path))
+
+
+def create_results_directory(model_name, evaluation_metrics, base_path="."):
+    """
+    Creates a results directory under base_path based on model name, evaluation metrics, and timestamp.
     Returns the path to the created directory.
     """
     # Format the evaluation metrics and timestamp for the directory name
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     metrics_str = "_".join(evaluation_metrics)
-    results_path = os.path.join("results", model_name, metrics_str, timestamp)
+    results_path = os.path.join(base_path, "results", model_name, metrics_str, timestamp)
     os.makedirs(results_path, exist_ok=True)
     return results_path
 
-def save_run_summary(results_path, model_name, evaluation_metrics, best_params, metrics):
+def save_run_summary(results_path, model_name, evaluation_metrics, best_params, metrics, writer=None):
     """
     Saves a summary of the run in JSON format in the results directory.
+    If writer is None, a local ArtifactWriter is used and waited on before returning.
     """
     summary = {
         "model_name": model_name,
@@ -120,6 +138,16 @@ def save_run_summary(results_path, model_name, evaluation_metrics, best_params,
         "metrics": metrics,
         "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     }
+    own_writer = writer is None
+    if own_writer:
+        writer = ArtifactWriter(os.path.join(results_path, "manifest.json"))
+
+    def write(tmp_path):
+        with open(tmp_path, "w") as f:
+            json.dump(summary, f, indent=4)
+
     # Save the summary to a JSON file in the results directory
-    with open(os.path.join(results_path, "run_summary.json"), "w") as f:
-        json.dump(summary, f, indent=4)
+    writer.submit(os.path.join(results_path, "run_summary.json"), write)
+
+    if own_writer:
+        writer.close()
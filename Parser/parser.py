@@ -48,7 +48,8 @@ def parse_config(yaml_path):
         "model_name": None,
         "cv": None,
         "param_grid": {},
-        "evaluation_metric": None
+        "evaluation_metric": None,
+        "feature_engineering": None
     }
 
     try:
@@ -123,6 +124,23 @@ def parse_config(yaml_path):
     except KeyError:
         raise ConfigError("Error parsing or validating hyperparameters in the configuration file.")
 
+    logging.info("Parsing feature engineering settings...")
+    feature_engineering = config.get("feature_engineering")
+    if feature_engineering:
+        if not isinstance(feature_engineering, dict):
+            raise ConfigError("The 'feature_engineering' section must be a mapping with a 'features' list.")
+        features = feature_engineering.get("features", [])
+        if not isinstance(features, list) or not features:
+            raise ConfigError("'feature_engineering.features' must be a non-empty list of feature definitions.")
+        for feature in features:
+            if not isinstance(feature, dict) or not feature.get("name") or not feature.get("op"):
+                raise ConfigError("Each item in 'feature_engineering.features' must define a 'name' and an 'op'.")
+        chunk_size = feature_engineering.get("chunk_size", 65536)
+        if not isinstance(chunk_size, int) or isinstance(chunk_size, bool) or chunk_size < 1:
+            raise ConfigError("'feature_engineering.chunk_size' must be a positive integer.")
+        parsed_config["feature_engineering"] = {"features": features, "chunk_size": chunk_size}
+    logging.info("Feature engineering settings parsed successfully.")
+
     logging.info("Configuration parsing completed successfully.")
     return parsed_config
 